@@ -1,5 +1,6 @@
 import { v } from "convex/values";
 import { query } from "./_generated/server";
+import { Id } from "./_generated/dataModel";
 
 // Dashboard stats for teachers/admins
 export const getDashboard = query({
@@ -10,10 +11,12 @@ export const getDashboard = query({
     const totalStudents = students.length;
 
     // Get courses (filtered by faculty if provided)
-    let courses = await ctx.db.query("courses").collect();
-    if (args.facultyId) {
-      courses = courses.filter((c) => c.facultyId === args.facultyId);
-    }
+    const courses = args.facultyId
+      ? await ctx.db
+          .query("courses")
+          .withIndex("by_faculty", (q) => q.eq("facultyId", args.facultyId!))
+          .collect()
+      : await ctx.db.query("courses").collect();
     const totalCourses = courses.length;
 
     // Get active sessions
@@ -53,14 +56,15 @@ export const getDashboard = query({
     const todayAttendanceRate =
       totalExpected > 0 ? (totalAttended / totalExpected) * 100 : 0;
 
-    // Get recent anomalies
+    // Get recent anomalies (newest five unresolved only)
     const anomalies = await ctx.db
       .query("anomalies")
       .withIndex("by_resolved", (q) => q.eq("isResolved", false))
-      .collect();
+      .order("desc")
+      .take(5);
 
     const recentAnomalies = await Promise.all(
-      anomalies.slice(0, 5).map(async (anomaly) => {
+      anomalies.map(async (anomaly) => {
         const student = anomaly.studentId
           ? await ctx.db.get(anomaly.studentId)
           : null;
@@ -79,10 +83,12 @@ export const getDashboard = query({
       })
     );
 
-    // Get upcoming sessions
-    const allSessions = await ctx.db.query("sessions").collect();
-    const upcomingSessions = allSessions
-      .filter((s) => s.sessionDate >= today)
+    // Get upcoming sessions (index range scan instead of the whole table)
+    const futureSessions = await ctx.db
+      .query("sessions")
+      .withIndex("by_date", (q) => q.gte("sessionDate", today))
+      .collect();
+    const upcomingSessions = futureSessions
       .sort((a, b) => {
         const dateCompare = a.sessionDate.localeCompare(b.sessionDate);
         if (dateCompare !== 0) return dateCompare;
@@ -150,16 +156,34 @@ export const getCourseAnalytics = query({
     let totalAbsent = 0;
     let totalLate = 0;
 
-    for (const session of sessions) {
-      const attendances = await ctx.db
-        .query("attendance")
-        .withIndex("by_session", (q) => q.eq("sessionId", session._id))
-        .collect();
+    // Per-student attended session counts, tallied from the same records
+    // so no per-student, per-session lookups are needed below
+    const attendedByStudent = new Map<Id<"students">, number>();
 
+    const sessionAttendances = await Promise.all(
+      sessions.map((session) =>
+        ctx.db
+          .query("attendance")
+          .withIndex("by_session", (q) => q.eq("sessionId", session._id))
+          .collect()
+      )
+    );
+
+    for (const attendances of sessionAttendances) {
+      const seen = new Set<Id<"students">>();
       for (const att of attendances) {
         if (att.status === "present") totalPresent++;
         else if (att.status === "absent") totalAbsent++;
         else if (att.status === "late") totalLate++;
+
+        if (seen.has(att.studentId)) continue;
+        seen.add(att.studentId);
+        if (att.status === "present" || att.status === "late") {
+          attendedByStudent.set(
+            att.studentId,
+            (attendedByStudent.get(att.studentId) || 0) + 1
+          );
+        }
       }
     }
 
@@ -176,23 +200,8 @@ export const getCourseAnalytics = query({
         const student = await ctx.db.get(enrollment.studentId);
         if (!student) return null;
 
-        let present = 0;
-        let total = 0;
-
-        for (const session of sessions) {
-          const att = await ctx.db
-            .query("attendance")
-            .withIndex("by_student_session", (q) =>
-              q.eq("studentId", enrollment.studentId).eq("sessionId", session._id)
-            )
-            .first();
-
-          total++;
-          if (att && (att.status === "present" || att.status === "late")) {
-            present++;
-          }
-        }
-
+        const present = attendedByStudent.get(enrollment.studentId) || 0;
+        const total = sessions.length;
         const attendanceRate = total > 0 ? (present / total) * 100 : 0;
 
         return {
@@ -272,17 +281,52 @@ export const getAttendanceTrend = query({
     const startDate = new Date();
     startDate.setDate(startDate.getDate() - days);
 
-    let sessions = await ctx.db.query("sessions").collect();
+    // Session dates are "YYYY-MM-DD" strings, so the range can be read
+    // straight off an index instead of scanning every session
+    const startStr = startDate.toISOString().split("T")[0];
+    const endStr = endDate.toISOString().split("T")[0];
+
+    const sessions = args.courseId
+      ? (
+          await ctx.db
+            .query("sessions")
+            .withIndex("by_course", (q) => q.eq("courseId", args.courseId!))
+            .collect()
+        ).filter((s) => s.sessionDate > startStr && s.sessionDate <= endStr)
+      : await ctx.db
+          .query("sessions")
+          .withIndex("by_date", (q) =>
+            q.gt("sessionDate", startStr).lte("sessionDate", endStr)
+          )
+          .collect();
 
-    // Filter by date range
-    sessions = sessions.filter((s) => {
-      const sessionDate = new Date(s.sessionDate);
-      return sessionDate >= startDate && sessionDate <= endDate;
-    });
+    // Enrollment counts are per course, so look each course up only once
+    const enrolledCounts = new Map<Id<"courses">, Promise<number>>();
+    const getEnrolledCount = (courseId: Id<"courses">) => {
+      let count = enrolledCounts.get(courseId);
+      if (!count) {
+        count = ctx.db
+          .query("courseEnrollments")
+          .withIndex("by_course", (q) => q.eq("courseId", courseId))
+          .collect()
+          .then((enrollments) => enrollments.length);
+        enrolledCounts.set(courseId, count);
+      }
+      return count;
+    };
 
-    if (args.courseId) {
-      sessions = sessions.filter((s) => s.courseId === args.courseId);
-    }
+    const sessionStats = await Promise.all(
+      sessions.map(async (session) => {
+        const [attendances, enrolled] = await Promise.all([
+          ctx.db
+            .query("attendance")
+            .withIndex("by_session", (q) => q.eq("sessionId", session._id))
+            .collect(),
+          getEnrolledCount(session.courseId),
+        ]);
+        return { session, attendances, enrolled };
+      })
+    );
 
     // Group by date
     const dailyStats: Record<
@@ -290,7 +334,7 @@ export const getAttendanceTrend = query({
       { date: string; present: number; absent: number; total: number }
     > = {};
 
-    for (const session of sessions) {
+    for (const { session, attendances, enrolled } of sessionStats) {
       if (!dailyStats[session.sessionDate]) {
         dailyStats[session.sessionDate] = {
           date: session.sessionDate,
@@ -300,18 +344,7 @@ export const getAttendanceTrend = query({
         };
       }
 
-      const attendances = await ctx.db
-        .query("attendance")
-        .withIndex("by_session", (q) => q.eq("sessionId", session._id))
-        .collect();
-
-      // Get enrolled count
-      const enrollments = await ctx.db
-        .query("courseEnrollments")
-        .withIndex("by_course", (q) => q.eq("courseId", session.courseId))
-        .collect();
-
-      dailyStats[session.sessionDate].total += enrollments.length;
+      dailyStats[session.sessionDate].total += enrolled;
 
       for (const att of attendances) {
         if (att.status === "present" || att.status === "late") {
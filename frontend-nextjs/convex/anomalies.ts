@@ -1,26 +1,84 @@
 import { v } from "convex/values";
-import { mutation, query } from "./_generated/server";
-import { Id } from "./_generated/dataModel";
+import { paginationOptsValidator } from "convex/server";
+import { mutation, query, MutationCtx, QueryCtx } from "./_generated/server";
+import { Doc, Id } from "./_generated/dataModel";
+
+// Filters shared by list and listPage
+const anomalyFilters = {
+  isResolved: v.optional(v.boolean()),
+  severity: v.optional(
+    v.union(
+      v.literal("low"),
+      v.literal("medium"),
+      v.literal("high"),
+      v.literal("critical")
+    )
+  ),
+  anomalyType: v.optional(v.string()),
+};
+
+// Attach student and session details to anomalies for display
+async function withAnomalyDetails(ctx: QueryCtx, anomalies: Doc<"anomalies">[]) {
+  // Many anomalies share a session, so resolve each session's details once
+  const sessionDetails = new Map<
+    Id<"sessions">,
+    Promise<{ sessionDate: string; courseName: string } | null>
+  >();
+  const getSessionDetails = (sessionId: Id<"sessions">) => {
+    let details = sessionDetails.get(sessionId);
+    if (!details) {
+      details = (async () => {
+        const session = await ctx.db.get(sessionId);
+        if (!session) return null;
+        const course = await ctx.db.get(session.courseId);
+        return {
+          sessionDate: session.sessionDate,
+          courseName: course?.courseName || "Unknown",
+        };
+      })();
+      sessionDetails.set(sessionId, details);
+    }
+    return details;
+  };
+
+  return await Promise.all(
+    anomalies.map(async (anomaly) => {
+      const [student, session] = await Promise.all([
+        anomaly.studentId ? ctx.db.get(anomaly.studentId) : null,
+        anomaly.sessionId ? getSessionDetails(anomaly.sessionId) : null,
+      ]);
+
+      return {
+        ...anomaly,
+        studentName: student?.name || "Unknown",
+        studentRollNo: student?.rollNo || "Unknown",
+        sessionDate: session?.sessionDate || "Unknown",
+        courseName: session?.courseName || "Unknown",
+      };
+    })
+  );
+}
 
 // Get all anomalies
 export const list = query({
-  args: {
-    isResolved: v.optional(v.boolean()),
-    severity: v.optional(
-      v.union(
-        v.literal("low"),
-        v.literal("medium"),
-        v.literal("high"),
-        v.literal("critical")
-      )
-    ),
-    anomalyType: v.optional(v.string()),
-  },
+  args: anomalyFilters,
   handler: async (ctx, args) => {
-    let anomalies = await ctx.db.query("anomalies").collect();
-
+    // Start from an index when a filter allows it instead of a full scan
+    let anomalies: Doc<"anomalies">[];
     if (args.isResolved !== undefined) {
-      anomalies = anomalies.filter((a) => a.isResolved === args.isResolved);
+      const isResolved = args.isResolved;
+      anomalies = await ctx.db
+        .query("anomalies")
+        .withIndex("by_resolved", (q) => q.eq("isResolved", isResolved))
+        .collect();
+    } else if (args.severity) {
+      const severity = args.severity;
+      anomalies = await ctx.db
+        .query("anomalies")
+        .withIndex("by_severity", (q) => q.eq("severity", severity))
+        .collect();
+    } else {
+      anomalies = await ctx.db.query("anomalies").collect();
     }
 
     if (args.severity) {
@@ -31,37 +89,44 @@ export const list = query({
       anomalies = anomalies.filter((a) => a.anomalyType === args.anomalyType);
     }
 
-    // Get student and session details
-    const anomaliesWithDetails = await Promise.all(
-      anomalies.map(async (anomaly) => {
-        const student = anomaly.studentId
-          ? await ctx.db.get(anomaly.studentId)
-          : null;
-        const session = anomaly.sessionId
-          ? await ctx.db.get(anomaly.sessionId)
-          : null;
-
-        let courseName = "Unknown";
-        if (session) {
-          const course = await ctx.db.get(session.courseId);
-          courseName = course?.courseName || "Unknown";
-        }
-
-        return {
-          ...anomaly,
-          studentName: student?.name || "Unknown",
-          studentRollNo: student?.rollNo || "Unknown",
-          sessionDate: session?.sessionDate || "Unknown",
-          courseName,
-        };
-      })
-    );
+    const anomaliesWithDetails = await withAnomalyDetails(ctx, anomalies);
 
     // Sort by attempt time (newest first)
     return anomaliesWithDetails.sort((a, b) => b.attemptTime - a.attemptTime);
   },
 });
 
+// Page through anomalies by attempt time (newest first), same filters and
+// details as list. The cursor continues from the last row returned, so
+// later pages cost the same as the first.
+export const listPage = query({
+  args: {
+    paginationOpts: paginationOptsValidator,
+    ...anomalyFilters,
+  },
+  handler: async (ctx, args) => {
+    const { isResolved, severity, anomalyType } = args;
+    let anomalies =
+      isResolved !== undefined
+        ? ctx.db
+            .query("anomalies")
+            .withIndex("by_resolved_attempt", (q) => q.eq("isResolved", isResolved))
+        : ctx.db.query("anomalies").withIndex("by_attempt_time");
+
+    if (severity) {
+      anomalies = anomalies.filter((q) => q.eq(q.field("severity"), severity));
+    }
+
+    if (anomalyType) {
+      anomalies = anomalies.filter((q) => q.eq(q.field("anomalyType"), anomalyType));
+    }
+
+    const page = await anomalies.order("desc").paginate(args.paginationOpts);
+
+    return { ...page, page: await withAnomalyDetails(ctx, page.page) };
+  },
+});
+
 // Get anomaly by ID
 export const getById = query({
   args: { id: v.id("anomalies") },
@@ -90,6 +155,25 @@ export const getById = query({
   },
 });
 
+// Mark an anomaly resolved in one patch, with a single timestamp
+async function closeAnomaly(
+  ctx: MutationCtx,
+  id: Id<"anomalies">,
+  resolvedBy: Id<"users">,
+  resolutionNotes: string
+) {
+  const now = Date.now();
+  await ctx.db.patch(id, {
+    isResolved: true,
+    resolvedBy,
+    resolutionNotes,
+    resolvedAt: now,
+    updatedAt: now,
+  });
+
+  return await ctx.db.get(id);
+}
+
 // Resolve anomaly
 export const resolve = mutation({
   args: {
@@ -98,15 +182,7 @@ export const resolve = mutation({
     resolutionNotes: v.string(),
   },
   handler: async (ctx, args) => {
-    await ctx.db.patch(args.id, {
-      isResolved: true,
-      resolvedBy: args.resolvedBy,
-      resolutionNotes: args.resolutionNotes,
-      resolvedAt: Date.now(),
-      updatedAt: Date.now(),
-    });
-
-    return await ctx.db.get(args.id);
+    return await closeAnomaly(ctx, args.id, args.resolvedBy, args.resolutionNotes);
   },
 });
 
@@ -118,15 +194,12 @@ export const dismiss = mutation({
     reason: v.string(),
   },
   handler: async (ctx, args) => {
-    await ctx.db.patch(args.id, {
-      isResolved: true,
-      resolvedBy: args.resolvedBy,
-      resolutionNotes: `Dismissed: ${args.reason}`,
-      resolvedAt: Date.now(),
-      updatedAt: Date.now(),
-    });
-
-    return await ctx.db.get(args.id);
+    return await closeAnomaly(
+      ctx,
+      args.id,
+      args.resolvedBy,
+      `Dismissed: ${args.reason}`
+    );
   },
 });
 
@@ -173,13 +246,15 @@ export const create = mutation({
 export const getRecent = query({
   args: { limit: v.optional(v.number()) },
   handler: async (ctx, args) => {
+    // Read only the newest unresolved rows instead of the whole backlog
     const anomalies = await ctx.db
       .query("anomalies")
       .withIndex("by_resolved", (q) => q.eq("isResolved", false))
-      .collect();
+      .order("desc")
+      .take(args.limit || 5);
 
     const anomaliesWithDetails = await Promise.all(
-      anomalies.slice(0, args.limit || 5).map(async (anomaly) => {
+      anomalies.map(async (anomaly) => {
         const student = anomaly.studentId
           ? await ctx.db.get(anomaly.studentId)
           : null;
@@ -202,31 +277,27 @@ export const getStats = query({
   handler: async (ctx) => {
     const anomalies = await ctx.db.query("anomalies").collect();
 
-    const total = anomalies.length;
-    const resolved = anomalies.filter((a) => a.isResolved).length;
-    const pending = total - resolved;
-
-    const bySeverity = {
-      critical: anomalies.filter((a) => a.severity === "critical").length,
-      high: anomalies.filter((a) => a.severity === "high").length,
-      medium: anomalies.filter((a) => a.severity === "medium").length,
-      low: anomalies.filter((a) => a.severity === "low").length,
-    };
-
+    // Tally every breakdown in a single pass over the table
+    let resolved = 0;
+    const bySeverity = { critical: 0, high: 0, medium: 0, low: 0 };
     const byType = {
-      face_mismatch: anomalies.filter((a) => a.anomalyType === "face_mismatch")
-        .length,
-      duplicate_attendance: anomalies.filter(
-        (a) => a.anomalyType === "duplicate_attendance"
-      ).length,
-      liveness_failed: anomalies.filter(
-        (a) => a.anomalyType === "liveness_failed"
-      ).length,
-      proxy_suspected: anomalies.filter(
-        (a) => a.anomalyType === "proxy_suspected"
-      ).length,
+      face_mismatch: 0,
+      duplicate_attendance: 0,
+      liveness_failed: 0,
+      proxy_suspected: 0,
     };
 
+    for (const anomaly of anomalies) {
+      if (anomaly.isResolved) resolved++;
+      bySeverity[anomaly.severity]++;
+      if (anomaly.anomalyType in byType) {
+        byType[anomaly.anomalyType as keyof typeof byType]++;
+      }
+    }
+
+    const total = anomalies.length;
+    const pending = total - resolved;
+
     return {
       total,
       resolved,
@@ -1,6 +1,45 @@
 import { v } from "convex/values";
-import { mutation, query, internalMutation } from "./_generated/server";
-import { Id } from "./_generated/dataModel";
+import { mutation, query, internalMutation, MutationCtx } from "./_generated/server";
+import { Doc, Id } from "./_generated/dataModel";
+
+// Record an anomaly raised while marking attendance
+async function logAnomaly(
+  ctx: MutationCtx,
+  anomaly: {
+    studentId: Id<"students">;
+    sessionId?: Id<"sessions">;
+    anomalyType: Doc<"anomalies">["anomalyType"];
+    severity: Doc<"anomalies">["severity"];
+    reason: string;
+    ipAddress?: string;
+    deviceInfo?: string;
+  }
+) {
+  const now = Date.now();
+  return await ctx.db.insert("anomalies", {
+    ...anomaly,
+    isResolved: false,
+    attemptTime: now,
+    createdAt: now,
+    updatedAt: now,
+  });
+}
+
+// Overall confidence for each verification method. Keyed by the schema's
+// method union so a new method can't be added without a scoring rule.
+const confidenceByMethod: Record<
+  Doc<"attendance">["verificationMethod"],
+  (factors: {
+    faceConfidence?: number;
+    qrScanned?: boolean;
+    fingerprintMatch?: boolean;
+  }) => number
+> = {
+  face_qr: ({ faceConfidence, qrScanned }) =>
+    qrScanned ? Math.min(100, (faceConfidence || 0) + 10) : faceConfidence || 0,
+  fingerprint: ({ fingerprintMatch }) => (fingerprintMatch ? 95 : 0),
+  manual: () => 100, // Manual entry by teacher
+};
 
 // Mark attendance
 export const mark = mutation({
@@ -34,55 +73,46 @@ export const mark = mutation({
       throw new Error("Session is not active for attendance");
     }
 
-    // Check for duplicate attendance
-    const existing = await ctx.db
-      .query("attendance")
-      .withIndex("by_student_session", (q) =>
-        q.eq("studentId", args.studentId).eq("sessionId", session._id)
-      )
-      .first();
+    // Duplicate check, enrollment check and the student lookup for the
+    // response are independent, so read them together
+    const [existing, enrollment, student] = await Promise.all([
+      ctx.db
+        .query("attendance")
+        .withIndex("by_student_session", (q) =>
+          q.eq("studentId", args.studentId).eq("sessionId", session._id)
+        )
+        .first(),
+      ctx.db
+        .query("courseEnrollments")
+        .withIndex("by_course_student", (q) =>
+          q.eq("courseId", session.courseId).eq("studentId", args.studentId)
+        )
+        .first(),
+      ctx.db.get(args.studentId),
+    ]);
 
     if (existing) {
       // Log anomaly for duplicate attempt
-      await ctx.db.insert("anomalies", {
+      await logAnomaly(ctx, {
         studentId: args.studentId,
         sessionId: session._id,
         anomalyType: "duplicate_attendance",
         severity: "medium",
         reason: "Student attempted to mark attendance again",
-        isResolved: false,
-        attemptTime: Date.now(),
         ipAddress: args.ipAddress,
         deviceInfo: args.deviceInfo,
-        createdAt: Date.now(),
-        updatedAt: Date.now(),
       });
 
       throw new Error("Attendance already marked for this session");
     }
 
     // Check if student is enrolled in the course
-    const enrollment = await ctx.db
-      .query("courseEnrollments")
-      .withIndex("by_course_student", (q) =>
-        q.eq("courseId", session.courseId).eq("studentId", args.studentId)
-      )
-      .first();
-
     if (!enrollment) {
       throw new Error("Student is not enrolled in this course");
     }
 
     // Calculate overall confidence
-    let overallConfidence = 0;
-    if (args.verificationMethod === "face_qr") {
-      overallConfidence = args.faceConfidence || 0;
-      if (args.qrScanned) overallConfidence = Math.min(100, overallConfidence + 10);
-    } else if (args.verificationMethod === "fingerprint") {
-      overallConfidence = args.fingerprintMatch ? 95 : 0;
-    } else {
-      overallConfidence = 100; // Manual entry by teacher
-    }
+    const overallConfidence = confidenceByMethod[args.verificationMethod](args);
 
     // Determine status based on time
     const now = new Date();
@@ -111,9 +141,6 @@ export const mark = mutation({
       updatedAt: Date.now(),
     });
 
-    // Get student info for response
-    const student = await ctx.db.get(args.studentId);
-
     return {
       success: true,
       message: `Attendance marked as ${status}`,
@@ -126,6 +153,40 @@ export const mark = mutation({
   },
 });
 
+// Set a student's attendance by hand: update their existing record for the
+// session if there is one, otherwise create it
+async function writeManualAttendance(
+  ctx: MutationCtx,
+  existingId: Id<"attendance"> | undefined,
+  record: {
+    sessionId: Id<"sessions">;
+    studentId: Id<"students">;
+    status: Doc<"attendance">["status"];
+  },
+  now: number
+) {
+  if (existingId) {
+    await ctx.db.patch(existingId, {
+      status: record.status,
+      verificationMethod: "manual",
+      updatedAt: now,
+    });
+    return existingId;
+  }
+
+  return await ctx.db.insert("attendance", {
+    studentId: record.studentId,
+    sessionId: record.sessionId,
+    status: record.status,
+    verificationMethod: "manual",
+    overallConfidence: 100,
+    markedAt: now,
+    isKiosk: false,
+    createdAt: now,
+    updatedAt: now,
+  });
+}
+
 // Mark attendance manually (by teacher)
 export const markManual = mutation({
   args: {
@@ -153,30 +214,58 @@ export const markManual = mutation({
       )
       .first();
 
-    if (existing) {
-      // Update existing record
-      await ctx.db.patch(existing._id, {
-        status: args.status,
-        verificationMethod: "manual",
-        updatedAt: Date.now(),
-      });
-      return existing._id;
+    return await writeManualAttendance(ctx, existing?._id, args, Date.now());
+  },
+});
+
+// Mark attendance manually for many students at once (by teacher)
+export const markManualBatch = mutation({
+  args: {
+    sessionId: v.id("sessions"),
+    records: v.array(
+      v.object({
+        studentId: v.id("students"),
+        status: v.union(
+          v.literal("present"),
+          v.literal("absent"),
+          v.literal("late"),
+          v.literal("excused")
+        ),
+      })
+    ),
+  },
+  handler: async (ctx, args) => {
+    const session = await ctx.db.get(args.sessionId);
+    if (!session) {
+      throw new Error("Session not found");
     }
 
-    // Create new attendance record
-    const attendanceId = await ctx.db.insert("attendance", {
-      studentId: args.studentId,
-      sessionId: args.sessionId,
-      status: args.status,
-      verificationMethod: "manual",
-      overallConfidence: 100,
-      markedAt: Date.now(),
-      isKiosk: false,
-      createdAt: Date.now(),
-      updatedAt: Date.now(),
-    });
+    // Load the session's existing records once instead of per student
+    const attendances = await ctx.db
+      .query("attendance")
+      .withIndex("by_session", (q) => q.eq("sessionId", args.sessionId))
+      .collect();
+    const existingByStudent = new Map<Id<"students">, Id<"attendance">>();
+    for (const att of attendances) {
+      if (!existingByStudent.has(att.studentId)) {
+        existingByStudent.set(att.studentId, att._id);
+      }
+    }
 
-    return attendanceId;
+    const now = Date.now();
+    const attendanceIds: Id<"attendance">[] = [];
+    for (const record of args.records) {
+      const attendanceId = await writeManualAttendance(
+        ctx,
+        existingByStudent.get(record.studentId),
+        { sessionId: args.sessionId, ...record },
+        now
+      );
+      existingByStudent.set(record.studentId, attendanceId);
+      attendanceIds.push(attendanceId);
+    }
+
+    return attendanceIds;
   },
 });
 
@@ -216,13 +305,24 @@ export const getByStudent = query({
       .withIndex("by_student", (q) => q.eq("studentId", args.studentId))
       .collect();
 
+    // A student's records repeat the same few courses, so fetch each once
+    const courses = new Map<Id<"courses">, Promise<Doc<"courses"> | null>>();
+    const getCourse = (courseId: Id<"courses">) => {
+      let course = courses.get(courseId);
+      if (!course) {
+        course = ctx.db.get(courseId);
+        courses.set(courseId, course);
+      }
+      return course;
+    };
+
     const attendancesWithDetails = await Promise.all(
       attendances.map(async (att) => {
         const session = await ctx.db.get(att.sessionId);
         if (!session) return null;
         if (args.courseId && session.courseId !== args.courseId) return null;
 
-        const course = await ctx.db.get(session.courseId);
+        const course = await getCourse(session.courseId);
         return {
           ...att,
           sessionDate: session.sessionDate,
@@ -280,8 +380,13 @@ export const getSessionSummary = query({
       .withIndex("by_course", (q) => q.eq("courseId", session.courseId))
       .collect();
 
-    const present = attendances.filter((a) => a.status === "present").length;
-    const late = attendances.filter((a) => a.status === "late").length;
+    // Tally present and late in a single pass over the records
+    let present = 0;
+    let late = 0;
+    for (const att of attendances) {
+      if (att.status === "present") present++;
+      else if (att.status === "late") late++;
+    }
     const absent = enrollments.length - present - late;
 
     return {
@@ -313,11 +418,18 @@ export const verifyAndMark = mutation({
       throw new Error("Invalid QR code format");
     }
 
+    // Look the session up once; both the anomaly log and marking need it
     const rollNo = parts[2];
-    const student = await ctx.db
-      .query("students")
-      .withIndex("by_roll_no", (q) => q.eq("rollNo", rollNo))
-      .first();
+    const [student, session] = await Promise.all([
+      ctx.db
+        .query("students")
+        .withIndex("by_roll_no", (q) => q.eq("rollNo", rollNo))
+        .first(),
+      ctx.db
+        .query("sessions")
+        .withIndex("by_code", (q) => q.eq("attendanceCode", args.sessionCode))
+        .first(),
+    ]);
 
     if (!student) {
       throw new Error("Student not found");
@@ -326,34 +438,19 @@ export const verifyAndMark = mutation({
     // Check face confidence threshold
     if (args.faceConfidence < 70) {
       // Log anomaly for face mismatch
-      const session = await ctx.db
-        .query("sessions")
-        .withIndex("by_code", (q) => q.eq("attendanceCode", args.sessionCode))
-        .first();
-
-      await ctx.db.insert("anomalies", {
+      await logAnomaly(ctx, {
         studentId: student._id,
         sessionId: session?._id,
         anomalyType: "face_mismatch",
         severity: args.faceConfidence < 50 ? "high" : "medium",
         reason: `Face confidence too low: ${args.faceConfidence}%`,
-        isResolved: false,
-        attemptTime: Date.now(),
         ipAddress: args.ipAddress,
         deviceInfo: args.deviceInfo,
-        createdAt: Date.now(),
-        updatedAt: Date.now(),
       });
 
       throw new Error("Face verification failed. Please try again or contact staff.");
     }
 
-    // Find session by code
-    const session = await ctx.db
-      .query("sessions")
-      .withIndex("by_code", (q) => q.eq("attendanceCode", args.sessionCode))
-      .first();
-
     if (!session) {
       throw new Error("Invalid session code");
     }
@@ -371,18 +468,14 @@ export const verifyAndMark = mutation({
       .first();
 
     if (existing) {
-      await ctx.db.insert("anomalies", {
+      await logAnomaly(ctx, {
         studentId: student._id,
         sessionId: session._id,
         anomalyType: "duplicate_attendance",
         severity: "medium",
         reason: "Student attempted to mark attendance again",
-        isResolved: false,
-        attemptTime: Date.now(),
         ipAddress: args.ipAddress,
         deviceInfo: args.deviceInfo,
-        createdAt: Date.now(),
-        updatedAt: Date.now(),
       });
 
       return {
@@ -453,22 +546,22 @@ export const verifyFingerprintAndMark = mutation({
     ipAddress: v.optional(v.string()),
   },
   handler: async (ctx, args) => {
-    // Find student by roll number (identification step)
-    const student = await ctx.db
-      .query("students")
-      .withIndex("by_roll_no", (q) => q.eq("rollNo", args.rollNo))
-      .first();
+    // Find student by roll number (identification step) and session by code
+    const [student, session] = await Promise.all([
+      ctx.db
+        .query("students")
+        .withIndex("by_roll_no", (q) => q.eq("rollNo", args.rollNo))
+        .first(),
+      ctx.db
+        .query("sessions")
+        .withIndex("by_code", (q) => q.eq("attendanceCode", args.sessionCode))
+        .first(),
+    ]);
 
     if (!student) {
       throw new Error("Student not found. Please check your roll number.");
     }
 
-    // Find session by code
-    const session = await ctx.db
-      .query("sessions")
-      .withIndex("by_code", (q) => q.eq("attendanceCode", args.sessionCode))
-      .first();
-
     if (!session) {
       throw new Error("Invalid session code");
     }
@@ -477,13 +570,21 @@ export const verifyFingerprintAndMark = mutation({
       throw new Error("Session is not active for attendance");
     }
 
-    // Check for duplicate
-    const existing = await ctx.db
-      .query("attendance")
-      .withIndex("by_student_session", (q) =>
-        q.eq("studentId", student._id).eq("sessionId", session._id)
-      )
-      .first();
+    // Check for duplicate and enrollment together
+    const [existing, enrollment] = await Promise.all([
+      ctx.db
+        .query("attendance")
+        .withIndex("by_student_session", (q) =>
+          q.eq("studentId", student._id).eq("sessionId", session._id)
+        )
+        .first(),
+      ctx.db
+        .query("courseEnrollments")
+        .withIndex("by_course_student", (q) =>
+          q.eq("courseId", session.courseId).eq("studentId", student._id)
+        )
+        .first(),
+    ]);
 
     if (existing) {
       return {
@@ -493,14 +594,6 @@ export const verifyFingerprintAndMark = mutation({
       };
     }
 
-    // Check enrollment
-    const enrollment = await ctx.db
-      .query("courseEnrollments")
-      .withIndex("by_course_student", (q) =>
-        q.eq("courseId", session.courseId).eq("studentId", student._id)
-      )
-      .first();
-
     if (!enrollment) {
       return {
         success: false,
@@ -554,8 +647,15 @@ export const markWithWebAuthn = mutation({
     ipAddress: v.optional(v.string()),
   },
   handler: async (ctx, args) => {
-    // Get student
-    const student = await ctx.db.get(args.studentId);
+    // Get student and find session by code
+    const [student, session] = await Promise.all([
+      ctx.db.get(args.studentId),
+      ctx.db
+        .query("sessions")
+        .withIndex("by_code", (q) => q.eq("attendanceCode", args.sessionCode))
+        .first(),
+    ]);
+
     if (!student) {
       throw new Error("Student not found");
     }
@@ -565,12 +665,6 @@ export const markWithWebAuthn = mutation({
       webauthnCounter: args.newCounter,
     });
 
-    // Find session by code
-    const session = await ctx.db
-      .query("sessions")
-      .withIndex("by_code", (q) => q.eq("attendanceCode", args.sessionCode))
-      .first();
-
     if (!session) {
       throw new Error("Invalid session code");
     }
@@ -579,13 +673,21 @@ export const markWithWebAuthn = mutation({
       throw new Error("Session is not active for attendance");
     }
 
-    // Check for duplicate
-    const existing = await ctx.db
-      .query("attendance")
-      .withIndex("by_student_session", (q) =>
-        q.eq("studentId", student._id).eq("sessionId", session._id)
-      )
-      .first();
+    // Check for duplicate and enrollment together
+    const [existing, enrollment] = await Promise.all([
+      ctx.db
+        .query("attendance")
+        .withIndex("by_student_session", (q) =>
+          q.eq("studentId", student._id).eq("sessionId", session._id)
+        )
+        .first(),
+      ctx.db
+        .query("courseEnrollments")
+        .withIndex("by_course_student", (q) =>
+          q.eq("courseId", session.courseId).eq("studentId", student._id)
+        )
+        .first(),
+    ]);
 
     if (existing) {
       return {
@@ -595,14 +697,6 @@ export const markWithWebAuthn = mutation({
       };
     }
 
-    // Check enrollment
-    const enrollment = await ctx.db
-      .query("courseEnrollments")
-      .withIndex("by_course_student", (q) =>
-        q.eq("courseId", session.courseId).eq("studentId", student._id)
-      )
-      .first();
-
     if (!enrollment) {
       return {
         success: false,
@@ -1,6 +1,7 @@
 import { v } from "convex/values";
 import { mutation, query } from "./_generated/server";
-import { Id } from "./_generated/dataModel";
+import { Doc, Id } from "./_generated/dataModel";
+import { toStudentSummary } from "./students";
 
 // Create a new course
 export const create = mutation({
@@ -49,7 +50,23 @@ export const list = query({
     facultyId: v.optional(v.id("users")),
   },
   handler: async (ctx, args) => {
-    let courses = await ctx.db.query("courses").collect();
+    // Start from the most selective index for the filters given
+    let courses: Doc<"courses">[];
+    if (args.facultyId) {
+      const facultyId = args.facultyId;
+      courses = await ctx.db
+        .query("courses")
+        .withIndex("by_faculty", (q) => q.eq("facultyId", facultyId))
+        .collect();
+    } else if (args.department) {
+      const department = args.department;
+      courses = await ctx.db
+        .query("courses")
+        .withIndex("by_department", (q) => q.eq("department", department))
+        .collect();
+    } else {
+      courses = await ctx.db.query("courses").collect();
+    }
 
     if (args.department) {
       courses = courses.filter((c) => c.department === args.department);
@@ -198,7 +215,7 @@ export const getEnrolledStudents = query({
         const student = await ctx.db.get(e.studentId);
         return student
           ? {
-              ...student,
+              ...toStudentSummary(student),
               enrolledAt: e.enrolledAt,
             }
           : null;
@@ -26,14 +26,22 @@ export const list = query({
     search: v.optional(v.string()),
   },
   handler: async (ctx, args) => {
-    let users = await ctx.db.query("users").collect();
-
-    // Filter to only admin and faculty
-    users = users.filter((u) => u.role === "admin" || u.role === "faculty");
-
-    if (args.role) {
-      users = users.filter((u) => u.role === args.role);
-    }
+    // Only admin and faculty accounts, read by role rather than scanning
+    // every user (most of which are student logins)
+    const roles: ("admin" | "faculty")[] = args.role
+      ? [args.role]
+      : ["admin", "faculty"];
+    const usersByRole = await Promise.all(
+      roles.map((role) =>
+        ctx.db
+          .query("users")
+          .withIndex("by_role", (q) => q.eq("role", role))
+          .collect()
+      )
+    );
+    let users = usersByRole
+      .flat()
+      .sort((a, b) => a._creationTime - b._creationTime);
 
     if (args.search) {
       const searchLower = args.search.toLowerCase();
@@ -80,9 +80,12 @@ export const create = mutation({
       throw new Error("Students cannot add networks");
     }
 
-    // Check for duplicate IP range
-    const existingNetworks = await ctx.db.query("allowedNetworks").collect();
-    const duplicate = existingNetworks.find((n) => n.ipRange === args.ipRange && n.isActive);
+    // Check for duplicate IP range (stops at the first active match)
+    const duplicate = await ctx.db
+      .query("allowedNetworks")
+      .withIndex("by_ip_range", (q) => q.eq("ipRange", args.ipRange))
+      .filter((q) => q.eq(q.field("isActive"), true))
+      .first();
     if (duplicate) {
       throw new Error("This IP range is already configured");
     }
@@ -255,13 +258,9 @@ export const verifyIp = query({
       .withIndex("by_active", (q) => q.eq("isActive", true))
       .collect();
 
-    // Filter out expired networks
-    const activeNetworks = networks.filter((n) => {
-      if (n.expiresAt && n.expiresAt < now) return false;
-      return true;
-    });
-
-    for (const network of activeNetworks) {
+    // Skip expired networks inline and stop at the first match
+    for (const network of networks) {
+      if (network.expiresAt && network.expiresAt < now) continue;
       if (isIpInRange(args.ipAddress, network.ipRange)) {
         return {
           allowed: true,
@@ -180,7 +180,9 @@ export default defineSchema({
     .index("by_session", ["sessionId"])
     .index("by_type", ["anomalyType"])
     .index("by_severity", ["severity"])
-    .index("by_resolved", ["isResolved"]),
+    .index("by_resolved", ["isResolved"])
+    .index("by_attempt_time", ["attemptTime"])
+    .index("by_resolved_attempt", ["isResolved", "attemptTime"]),
 
   // Auth sessions for JWT-like token management
   authSessions: defineTable({
@@ -209,5 +211,6 @@ export default defineSchema({
   })
     .index("by_type", ["networkType"])
     .index("by_active", ["isActive"])
-    .index("by_added_by", ["addedBy"]),
+    .index("by_added_by", ["addedBy"])
+    .index("by_ip_range", ["ipRange"]),
 });
@@ -22,6 +22,10 @@ export const seedDemoData = mutation({
   handler: async (ctx) => {
     const now = Date.now();
 
+    // Demo passwords are shared, so hash each one once up front
+    const facultyPasswordHash = simpleHash("faculty123");
+    const studentPasswordHash = simpleHash("student123");
+
     // Create admin user
     const adminId = await ctx.db.insert("users", {
       email: "admin@smartattend.com",
@@ -36,7 +40,7 @@ export const seedDemoData = mutation({
     // Create faculty users
     const faculty1Id = await ctx.db.insert("users", {
       email: "prof.sharma@college.edu",
-      passwordHash: simpleHash("faculty123"),
+      passwordHash: facultyPasswordHash,
       fullName: "Dr. Rajesh Sharma",
       role: "faculty",
       isActive: true,
@@ -46,7 +50,7 @@ export const seedDemoData = mutation({
 
     const faculty2Id = await ctx.db.insert("users", {
       email: "prof.patel@college.edu",
-      passwordHash: simpleHash("faculty123"),
+      passwordHash: facultyPasswordHash,
       fullName: "Dr. Priya Patel",
       role: "faculty",
       isActive: true,
@@ -88,7 +92,7 @@ export const seedDemoData = mutation({
       // Create user account for student
       await ctx.db.insert("users", {
         email: s.email,
-        passwordHash: simpleHash("student123"),
+        passwordHash: studentPasswordHash,
         fullName: s.name,
         role: "student",
         isActive: true,
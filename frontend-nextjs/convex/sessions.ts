@@ -1,6 +1,6 @@
 import { v } from "convex/values";
 import { mutation, query } from "./_generated/server";
-import { Id } from "./_generated/dataModel";
+import { Doc, Id } from "./_generated/dataModel";
 
 // Generate a 6-character attendance code
 function generateAttendanceCode(): string {
@@ -57,7 +57,30 @@ export const list = query({
     isActive: v.optional(v.boolean()),
   },
   handler: async (ctx, args) => {
-    let sessions = await ctx.db.query("sessions").collect();
+    // Start from the most selective index for the filters given; the
+    // remaining filters below are then applied to that smaller set
+    let sessions: Doc<"sessions">[];
+    if (args.courseId) {
+      const courseId = args.courseId;
+      sessions = await ctx.db
+        .query("sessions")
+        .withIndex("by_course", (q) => q.eq("courseId", courseId))
+        .collect();
+    } else if (args.date) {
+      const date = args.date;
+      sessions = await ctx.db
+        .query("sessions")
+        .withIndex("by_date", (q) => q.eq("sessionDate", date))
+        .collect();
+    } else if (args.isActive !== undefined) {
+      const isActive = args.isActive;
+      sessions = await ctx.db
+        .query("sessions")
+        .withIndex("by_active", (q) => q.eq("isActive", isActive))
+        .collect();
+    } else {
+      sessions = await ctx.db.query("sessions").collect();
+    }
 
     if (args.courseId) {
       sessions = sessions.filter((s) => s.courseId === args.courseId);
@@ -1,6 +1,6 @@
 import { v } from "convex/values";
 import { mutation, query } from "./_generated/server";
-import { Id } from "./_generated/dataModel";
+import { Doc, Id } from "./_generated/dataModel";
 
 // Simple hash function for password (same as in seed.ts)
 function simpleHash(password: string): string {
@@ -24,6 +24,13 @@ function generateQRCode(rollNo: string, collegeId: string): string {
   return `SMARTATTEND:${collegeId}:${rollNo}:${Date.now()}`;
 }
 
+// Strip biometric payloads (face embedding, fingerprint hash, WebAuthn key)
+// from a student for list views, which only render the has* flags
+export function toStudentSummary(student: Doc<"students">) {
+  const { faceEmbedding, fingerprintHash, webauthnPublicKey, ...summary } = student;
+  return summary;
+}
+
 // Create a new student (creates both users and students records)
 export const create = mutation({
   args: {
@@ -108,11 +115,14 @@ export const list = query({
     search: v.optional(v.string()),
   },
   handler: async (ctx, args) => {
-    let students = await ctx.db.query("students").collect();
-
-    if (args.department) {
-      students = students.filter((s) => s.department === args.department);
-    }
+    // Read one department off its index instead of every student
+    const department = args.department;
+    let students = department
+      ? await ctx.db
+          .query("students")
+          .withIndex("by_department", (q) => q.eq("department", department))
+          .collect()
+      : await ctx.db.query("students").collect();
 
     if (args.semester) {
       students = students.filter((s) => s.semester === args.semester);
@@ -128,7 +138,7 @@ export const list = query({
       );
     }
 
-    return students;
+    return students.map(toStudentSummary);
   },
 });
 
@@ -151,6 +161,26 @@ export const getByRollNo = query({
   },
 });
 
+// Get only what the kiosk needs to verify a scanned student's face
+export const getVerificationProfile = query({
+  args: { rollNo: v.string() },
+  handler: async (ctx, args) => {
+    const student = await ctx.db
+      .query("students")
+      .withIndex("by_roll_no", (q) => q.eq("rollNo", args.rollNo))
+      .first();
+    if (!student) return null;
+
+    return {
+      _id: student._id,
+      name: student.name,
+      rollNo: student.rollNo,
+      hasFaceData: student.hasFaceData,
+      faceEmbedding: student.faceEmbedding,
+    };
+  },
+});
+
 // Get student by email
 export const getByEmail = query({
   args: { email: v.string() },
@@ -263,55 +293,44 @@ export const update = mutation({
 export const remove = mutation({
   args: { id: v.id("students") },
   handler: async (ctx, args) => {
-    // Find and delete linked user account
-    const linkedUser = await ctx.db
-      .query("users")
-      .withIndex("by_student", (q) => q.eq("studentId", args.id))
-      .first();
-
+    // The related records are independent, so look them all up at once
+    const [linkedUser, enrollments, attendanceRecords, anomalies] =
+      await Promise.all([
+        ctx.db
+          .query("users")
+          .withIndex("by_student", (q) => q.eq("studentId", args.id))
+          .first(),
+        ctx.db
+          .query("courseEnrollments")
+          .withIndex("by_student", (q) => q.eq("studentId", args.id))
+          .collect(),
+        ctx.db
+          .query("attendance")
+          .withIndex("by_student", (q) => q.eq("studentId", args.id))
+          .collect(),
+        ctx.db
+          .query("anomalies")
+          .withIndex("by_student", (q) => q.eq("studentId", args.id))
+          .collect(),
+      ]);
+
+    // Delete linked user account along with any auth sessions for it
     if (linkedUser) {
-      // Also delete any auth sessions for this user
       const authSessions = await ctx.db
         .query("authSessions")
         .withIndex("by_user", (q) => q.eq("userId", linkedUser._id))
         .collect();
-      
-      for (const session of authSessions) {
-        await ctx.db.delete(session._id);
-      }
 
+      await Promise.all(authSessions.map((session) => ctx.db.delete(session._id)));
       await ctx.db.delete(linkedUser._id);
     }
 
-    // Delete course enrollments for this student
-    const enrollments = await ctx.db
-      .query("courseEnrollments")
-      .withIndex("by_student", (q) => q.eq("studentId", args.id))
-      .collect();
-
-    for (const enrollment of enrollments) {
-      await ctx.db.delete(enrollment._id);
-    }
-
-    // Delete attendance records for this student
-    const attendanceRecords = await ctx.db
-      .query("attendance")
-      .withIndex("by_student", (q) => q.eq("studentId", args.id))
-      .collect();
-
-    for (const record of attendanceRecords) {
-      await ctx.db.delete(record._id);
-    }
-
-    // Delete anomalies for this student
-    const anomalies = await ctx.db
-      .query("anomalies")
-      .withIndex("by_student", (q) => q.eq("studentId", args.id))
-      .collect();
-
-    for (const anomaly of anomalies) {
-      await ctx.db.delete(anomaly._id);
-    }
+    // Delete course enrollments, attendance records and anomalies
+    await Promise.all([
+      ...enrollments.map((enrollment) => ctx.db.delete(enrollment._id)),
+      ...attendanceRecords.map((record) => ctx.db.delete(record._id)),
+      ...anomalies.map((anomaly) => ctx.db.delete(anomaly._id)),
+    ]);
 
     // Finally delete the student
     await ctx.db.delete(args.id);
@@ -474,7 +493,7 @@ export const getByCourse = query({
       enrollments.map((e) => ctx.db.get(e.studentId))
     );
 
-    return students.filter((s) => s !== null);
+    return students.filter((s) => s !== null).map((s) => toStudentSummary(s!));
   },
 });
 
@@ -492,13 +511,24 @@ export const getAttendanceReport = query({
       .withIndex("by_student", (q) => q.eq("studentId", args.id))
       .collect();
 
+    // Courses repeat across a student's sessions; look each up once
+    const courses = new Map<Id<"courses">, Promise<Doc<"courses"> | null>>();
+    const getCourse = (courseId: Id<"courses">) => {
+      let course = courses.get(courseId);
+      if (!course) {
+        course = ctx.db.get(courseId);
+        courses.set(courseId, course);
+      }
+      return course;
+    };
+
     // Get session and course details for each record
     const records = await Promise.all(
       attendanceRecords.map(async (att) => {
         const session = await ctx.db.get(att.sessionId);
         if (!session) return null;
         
-        const course = await ctx.db.get(session.courseId);
+        const course = await getCourse(session.courseId);
         if (!course) return null;
 
         return {
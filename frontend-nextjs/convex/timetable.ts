@@ -126,6 +126,20 @@ export const generateSessions = mutation({
     const end = new Date(args.endDate);
     const sessionsCreated: Id<"sessions">[] = [];
 
+    // Load the sessions already in the range once, keyed by course, date
+    // and start time, instead of scanning the sessions table per entry
+    const sessionKey = (courseId: Id<"courses">, date: string, startTime: string) =>
+      `${courseId}|${date}|${startTime}`;
+    const existingSessions = await ctx.db
+      .query("sessions")
+      .withIndex("by_date", (q) =>
+        q.gte("sessionDate", args.startDate).lte("sessionDate", args.endDate)
+      )
+      .collect();
+    const existingKeys = new Set(
+      existingSessions.map((s) => sessionKey(s.courseId, s.sessionDate, s.startTime))
+    );
+
     // Iterate through each day in the range
     for (let d = new Date(start); d <= end; d.setDate(d.getDate() + 1)) {
       const dayOfWeek = d.getDay();
@@ -136,18 +150,8 @@ export const generateSessions = mutation({
 
       for (const entry of dayEntries) {
         // Check if session already exists for this date and timetable entry
-        const existing = await ctx.db
-          .query("sessions")
-          .filter((q) =>
-            q.and(
-              q.eq(q.field("courseId"), entry.courseId),
-              q.eq(q.field("sessionDate"), dateStr),
-              q.eq(q.field("startTime"), entry.startTime)
-            )
-          )
-          .first();
-
-        if (!existing) {
+        const key = sessionKey(entry.courseId, dateStr, entry.startTime);
+        if (!existingKeys.has(key)) {
           const sessionId = await ctx.db.insert("sessions", {
             courseId: entry.courseId,
             sessionDate: dateStr,
@@ -162,6 +166,7 @@ export const generateSessions = mutation({
             updatedAt: Date.now(),
           });
           sessionsCreated.push(sessionId);
+          existingKeys.add(key);
         }
       }
     }
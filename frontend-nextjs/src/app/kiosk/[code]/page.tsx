@@ -57,7 +57,7 @@ export default function KioskAttendancePage() {
   // Convex queries and mutations
   const session = useQuery(api.sessions.getByCode, { code });
   const scannedStudent = useQuery(
-    api.students.getByRollNo,
+    api.students.getVerificationProfile,
     scannedStudentRollNo ? { rollNo: scannedStudentRollNo } : "skip"
   );
   const verifyAndMark = useMutation(api.attendance.verifyAndMark);
@@ -1,12 +1,14 @@
 'use client';
 
 import { useState } from 'react';
-import { useQuery, useMutation } from 'convex/react';
+import { usePaginatedQuery, useMutation } from 'convex/react';
 import { api } from '@convex/_generated/api';
 import { Id } from '@convex/_generated/dataModel';
 import { AlertTriangle, Check, X, Loader2 } from 'lucide-react';
 import { useAuth } from '@/app/providers';
 
+const ANOMALIES_PAGE_SIZE = 20;
+
 function cn(...classes: (string | boolean | undefined)[]): string {
   return classes.filter(Boolean).join(' ');
 }
@@ -42,12 +44,13 @@ export default function AnomaliesPage() {
   const { user } = useAuth();
   const [filter, setFilter] = useState<'pending' | 'resolved' | 'all'>('pending');
 
-  // Convex queries
-  const anomalies = useQuery(
-    api.anomalies.list,
+  // Convex queries (newest first, one page at a time)
+  const { results: anomalies, status, loadMore } = usePaginatedQuery(
+    api.anomalies.listPage,
     filter === 'all' 
       ? {} 
-      : { isResolved: filter === 'resolved' }
+      : { isResolved: filter === 'resolved' },
+    { initialNumItems: ANOMALIES_PAGE_SIZE }
   );
 
   // Convex mutations
@@ -86,7 +89,7 @@ export default function AnomaliesPage() {
     }
   };
 
-  const loading = anomalies === undefined;
+  const loading = status === 'LoadingFirstPage';
 
   return (
     <div className="space-y-6">
@@ -201,6 +204,19 @@ export default function AnomaliesPage() {
               </div>
             </div>
           ))}
+
+          {status !== 'Exhausted' && (
+            <div className="flex justify-center">
+              <button
+                onClick={() => loadMore(ANOMALIES_PAGE_SIZE)}
+                disabled={status !== 'CanLoadMore'}
+                className="btn-secondary btn-sm"
+              >
+                {status === 'LoadingMore' && <Loader2 className="w-4 h-4 mr-1 animate-spin" />}
+                Load more
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
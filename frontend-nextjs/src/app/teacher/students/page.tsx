@@ -557,7 +557,6 @@ function EnrollModal({
     setError('');
 
     try {
-      console.log('[EnrollFace] Extracting embedding from video:', video.videoWidth, 'x', video.videoHeight);
       const result = await extractFaceEmbedding(video);
 
       if (!result.success || !result.embedding) {
@@ -569,8 +568,6 @@ function EnrollModal({
         setLoading(false);
         return;
       }
-
-      console.log('[EnrollFace] Got embedding with', result.embedding.length, 'dimensions');
       
       await enrollFaceMutation({
         id: studentId,
@@ -89,12 +89,19 @@ export function createFaceError(type: FaceErrorType): FaceError {
   };
 }
 
+// In-flight initialization, shared so concurrent callers load the models once
+let initPromise: Promise<boolean> | null = null;
+
 /**
  * Initialize face-api.js models
  */
-export async function initializeFaceAPI(): Promise<boolean> {
-  if (isInitialized) return true;
-  
+export function initializeFaceAPI(): Promise<boolean> {
+  if (isInitialized) return Promise.resolve(true);
+  initPromise ??= loadFaceAPI();
+  return initPromise;
+}
+
+async function loadFaceAPI(): Promise<boolean> {
   try {
     // Dynamically import face-api.js
     const faceapiModule = await import('face-api.js');
@@ -131,20 +138,30 @@ function isVideoReady(video: HTMLVideoElement): boolean {
   return hasValidDimensions && hasEnoughData && isPlaying;
 }
 
+// Canvases reused by the polled detectFaces path so each frame doesn't
+// allocate one. A call checks a canvas out for its whole detection, so an
+// overlapping poll draws into a different canvas rather than over its frame.
+const idleDetectionCanvases: HTMLCanvasElement[] = [];
+
 /**
  * Create a canvas from video element for safe processing
  * This avoids the "canvas element with a width or height of 0" error
+ * Pass `target` to draw into an existing canvas instead of a new one
  */
-function createCanvasFromVideo(video: HTMLVideoElement): HTMLCanvasElement | null {
+function createCanvasFromVideo(
+  video: HTMLVideoElement,
+  target?: HTMLCanvasElement
+): HTMLCanvasElement | null {
   if (!isVideoReady(video)) {
     console.warn('[FaceService] Video not ready for canvas creation');
     return null;
   }
 
   try {
-    const canvas = document.createElement('canvas');
-    canvas.width = video.videoWidth;
-    canvas.height = video.videoHeight;
+    const canvas = target ?? document.createElement('canvas');
+    // Resizing clears the backing store, so only do it when the video changes
+    if (canvas.width !== video.videoWidth) canvas.width = video.videoWidth;
+    if (canvas.height !== video.videoHeight) canvas.height = video.videoHeight;
     
     const ctx = canvas.getContext('2d');
     if (!ctx) {
@@ -201,8 +218,6 @@ export async function detectFaces(
     await initializeFaceAPI();
   }
 
-  // For video elements, create a canvas snapshot to avoid drawImage errors
-  let inputElement: HTMLImageElement | HTMLCanvasElement = imageElement as HTMLImageElement | HTMLCanvasElement;
   let frameWidth = 0;
   let frameHeight = 0;
 
@@ -215,18 +230,6 @@ export async function detectFaces(
         error: createFaceError(FaceErrorType.CAMERA_NOT_READY),
       };
     }
-    
-    // Create canvas from video to avoid timing issues
-    const canvas = createCanvasFromVideo(imageElement);
-    if (!canvas) {
-      return { 
-        detected: false, 
-        count: 0, 
-        faces: [],
-        error: createFaceError(FaceErrorType.CAMERA_NOT_READY),
-      };
-    }
-    inputElement = canvas;
     frameWidth = imageElement.videoWidth;
     frameHeight = imageElement.videoHeight;
   } else {
@@ -254,7 +257,26 @@ export async function detectFaces(
     };
   }
 
+  // For video elements, create a canvas snapshot to avoid drawImage errors
+  let inputElement: HTMLImageElement | HTMLCanvasElement = imageElement as HTMLImageElement | HTMLCanvasElement;
+  let pooledCanvas: HTMLCanvasElement | undefined;
+
   try {
+    if (imageElement instanceof HTMLVideoElement) {
+      // Create canvas from video to avoid timing issues
+      pooledCanvas = idleDetectionCanvases.pop() ?? document.createElement('canvas');
+      const canvas = createCanvasFromVideo(imageElement, pooledCanvas);
+      if (!canvas) {
+        return { 
+          detected: false, 
+          count: 0, 
+          faces: [],
+          error: createFaceError(FaceErrorType.CAMERA_NOT_READY),
+        };
+      }
+      inputElement = canvas;
+    }
+
     const detections = await faceapi
       .detectAllFaces(inputElement, new faceapi.TinyFaceDetectorOptions())
       .withFaceLandmarks();
@@ -342,6 +364,8 @@ export async function detectFaces(
       faces: [],
       error: createFaceError(FaceErrorType.UNKNOWN),
     };
+  } finally {
+    if (pooledCanvas) idleDetectionCanvases.push(pooledCanvas);
   }
 }
 
@@ -407,11 +431,13 @@ export async function extractFaceEmbedding(
   }
 
   try {
-    // First check for multiple faces
-    const allDetections = await faceapi
-      .detectAllFaces(inputElement, new faceapi.TinyFaceDetectorOptions());
+    // One detector pass gives both the face count and the descriptor
+    const detections = await faceapi
+      .detectAllFaces(inputElement, new faceapi.TinyFaceDetectorOptions())
+      .withFaceLandmarks()
+      .withFaceDescriptors();
     
-    if (allDetections.length === 0) {
+    if (detections.length === 0) {
       return {
         success: false,
         embedding: null,
@@ -419,7 +445,7 @@ export async function extractFaceEmbedding(
       };
     }
 
-    if (allDetections.length > 1) {
+    if (detections.length > 1) {
       return {
         success: false,
         embedding: null,
@@ -427,19 +453,7 @@ export async function extractFaceEmbedding(
       };
     }
 
-    // Now get the full detection with descriptor
-    const detection = await faceapi
-      .detectSingleFace(inputElement, new faceapi.TinyFaceDetectorOptions())
-      .withFaceLandmarks()
-      .withFaceDescriptor();
-
-    if (!detection) {
-      return {
-        success: false,
-        embedding: null,
-        error: createFaceError(FaceErrorType.EXTRACTION_FAILED),
-      };
-    }
+    const detection = detections[0];
 
     // Check detection quality
     if (detection.detection.score < 0.7) {
@@ -498,12 +512,13 @@ export function compareFaceEmbeddings(embedding1: number[], embedding2: number[]
     return 0;
   }
 
-  // Calculate Euclidean distance
-  let distance = 0;
-  for (let i = 0; i < embedding1.length; i++) {
-    distance += Math.pow(embedding1[i] - embedding2[i], 2);
+  // Calculate Euclidean distance (plain multiply keeps the loop free of calls)
+  let sumSquares = 0;
+  for (let i = 0, n = embedding1.length; i < n; i++) {
+    const diff = embedding1[i] - embedding2[i];
+    sumSquares += diff * diff;
   }
-  distance = Math.sqrt(distance);
+  const distance = Math.sqrt(sumSquares);
 
   // Convert distance to similarity percentage
   // Typical distance for same person: 0.0 - 0.6
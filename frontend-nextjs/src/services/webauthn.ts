@@ -36,15 +36,40 @@ function generateChallenge(): Uint8Array {
   return challenge;
 }
 
-/**
- * Check if WebAuthn is supported and available
- */
-export async function checkWebAuthnSupport(): Promise<{
+type WebAuthnSupport = {
   supported: boolean;
   platformAuthenticator: boolean;
   message: string;
   isSecureContext: boolean;
-}> {
+};
+
+// Device capabilities don't change during a page's lifetime, so probe once
+let supportCheck: Promise<WebAuthnSupport> | null = null;
+
+/**
+ * Check if WebAuthn is supported and available
+ */
+export function checkWebAuthnSupport(): Promise<WebAuthnSupport> {
+  if (typeof window === 'undefined') {
+    return probeWebAuthnSupport();
+  }
+  if (!supportCheck) {
+    supportCheck = probeWebAuthnSupport().catch(() => {
+      // Only successful probes are cached; let the next call retry
+      supportCheck = null;
+      return {
+        supported: false,
+        platformAuthenticator: false,
+        message: 'Failed to check WebAuthn availability',
+        isSecureContext: true,
+      };
+    });
+  }
+  return supportCheck;
+}
+
+// Throws if the platform authenticator check itself fails
+async function probeWebAuthnSupport(): Promise<WebAuthnSupport> {
   if (typeof window === 'undefined') {
     return {
       supported: false,
@@ -74,25 +99,16 @@ export async function checkWebAuthnSupport(): Promise<{
     };
   }
 
-  try {
-    const platformAvailable = await PublicKeyCredential.isUserVerifyingPlatformAuthenticatorAvailable();
-    
-    return {
-      supported: true,
-      platformAuthenticator: platformAvailable,
-      isSecureContext: true,
-      message: platformAvailable 
-        ? 'Fingerprint/Face ID available' 
-        : 'WebAuthn supported but no platform authenticator (fingerprint/Face ID)',
-    };
-  } catch (error) {
-    return {
-      supported: false,
-      platformAuthenticator: false,
-      message: 'Failed to check WebAuthn availability',
-      isSecureContext: true,
-    };
-  }
+  const platformAvailable = await PublicKeyCredential.isUserVerifyingPlatformAuthenticatorAvailable();
+  
+  return {
+    supported: true,
+    platformAuthenticator: platformAvailable,
+    isSecureContext: true,
+    message: platformAvailable 
+      ? 'Fingerprint/Face ID available' 
+      : 'WebAuthn supported but no platform authenticator (fingerprint/Face ID)',
+  };
 }
 
 /**